@@ -1,16 +1,23 @@
-import re
 from pathlib import Path
 
+_TYPES = {"feat", "fix", "docs", "refactor", "chore"}
+_PREFIX_MAP = {
+    "add": "feat",
+    "create": "feat",
+    "implement": "feat",
+    "fix": "fix",
+    "repair": "fix",
+}
+
 msg_file = Path(__import__("sys").argv[1])
 msg = msg_file.read_text().strip()
 
-if not re.match(r"^(feat|fix|docs|refactor|chore):", msg, re.I):
-    lower = msg.lower()
+if msg.split(":", 1)[0].lower() not in _TYPES:
+    parts = msg.split(None, 1)
+    first = parts[0].lower() if parts else ""
 
-    if lower.startswith(("add ", "create ", "implement ")):
-        msg = "feat: " + re.sub(r"^(add|create|implement)\s+", "", msg, flags=re.I)
-    elif lower.startswith(("fix ", "repair ")):
-        msg = "fix: " + re.sub(r"^(fix|repair)\s+", "", msg, flags=re.I)
+    if first in _PREFIX_MAP and len(parts) == 2:
+        msg = f"{_PREFIX_MAP[first]}: {parts[1]}"
     else:
         msg = "chore: " + msg
 
@@ -1,60 +1,118 @@
-"""Main CLI entry point using Invoke framework."""
-
+"""Main CLI entry point using argparse."""
+
+import argparse
+import concurrent.futures
+import functools
+import hashlib
+import os
+import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
 import time
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 
-from invoke.collection import Collection
-from invoke.program import Program
-from invoke.tasks import task
-
-from config.parser import ConfigurationParser
-from podman.container_manager import ContainerManager
-from provision.ansible import ProvisioningFailedError, ProvisioningManager
 from utils.helpers import (
-    ConfigInvalidError,
-    ConfigNotFoundError,
     ErrorCode,
     InfrastructureExistsError,
     InfrastructureState,
+    ProvisioningFailedError,
     VagrantpError,
+    cli_error_handler,
+    pump_process_output,
     run_command,
 )
-from vagrant.vm_manager import VMManager
+
+# VMManager, ContainerManager, and ProvisioningManager are imported lazily
+# inside the tasks that need them, so e.g. `vagrantp ssh` against a VM never
+# pays the import cost of the podman or provisioning modules.
 
 _PLAYBOOK_TEMP_DIR = f"{tempfile.gettempdir()}/vagrantp_playbooks_{uuid.uuid4().hex[:8]}"
 
+# Computed once at import: every task needs the directory name as the
+# INFRA_ID fallback, and the CLI never changes directory mid-run
+_CWD_NAME = Path.cwd().name
+
+# Defaults merged over the parsed configuration so per-call-site default
+# arguments (each evaluated eagerly by dict.get) disappear
+_CONFIG_DEFAULTS = {"INFRA_TYPE": "vm", "IMAGE": "alpine:latest"}
+
+# Accepted removal confirmations, compared casefolded
+_YES_RESPONSES = frozenset({"yes", "y"})
+
+# Exit codes bound once: the error paths then skip the enum attribute
+# plus value-descriptor lookups per raise
+_EXIT_CONFIG = ErrorCode.CONFIG_ERROR.value
+
+# Enum members bound once; they are singletons, so tasks compare with `is`
+_NOT_CREATED = InfrastructureState.NOT_CREATED
+_RUNNING = InfrastructureState.RUNNING
+_STOPPED = InfrastructureState.STOPPED
+
+# Banner templates compiled once at import; tasks fill them with a single
+# format call instead of rebuilding one f-string per line
+_TPL_DRY_RUN = "✓ Configuration validated\n  INFRA_TYPE: {t}\n  PROVIDER: {p}"
+_TPL_UP_RESTART = (
+    "✓ Configuration validated\n→ Starting stopped infrastructure...\n  INFRA_TYPE: {t}\n  ID: {i}"
+)
+_TPL_UP_START = (
+    "✓ Configuration validated\n"
+    "→ Starting infrastructure...\n"
+    "  INFRA_TYPE: {t}\n"
+    "{source}\n"
+    "  ID: {i}"
+)
+
+
+def _emit(*lines: str) -> None:
+    """Write status lines with a single stdout write.
+
+    Tasks emit bursts of 3-8 status lines; joining them into one write
+    avoids a syscall and a stdout-lock acquisition per line.
 
-@task
-def version(c):
+    Args:
+        lines: Lines to write, without trailing newlines.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def version():
     """Show version information."""
     print("Vagrantp 1.0.0")
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_container_runtime() -> str | None:
     """Detect container runtime (docker or podman).
 
+    The result is a pure environment probe that cannot change mid-run, so it
+    is cached for the process lifetime. A PATH scan via shutil.which avoids
+    spawning `podman --version` / `docker --version` subprocesses entirely.
+
     Returns:
         Runtime name ('podman', 'docker', or None if neither found).
     """
-    try:
-        run_command(["podman", "--version"], check=False)
+    if shutil.which("podman"):
         return "podman"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
 
-    try:
-        run_command(["docker", "--version"], check=False)
+    if shutil.which("docker"):
         return "docker"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
 
     return None
 
 
+# Marker written inside the container after a successful Ansible install, so
+# later runs can confirm availability with a single cheap test -f
+_ANSIBLE_MARKER = "/var/lib/vagrantp/.ansible_ok"
+
+# Containers already confirmed to have Ansible, keyed by (runtime, container_id);
+# repeat checks within one process become a set lookup instead of a container exec
+_ansible_ready: set[tuple[str, str]] = set()
+
+
 def _check_ansible_in_container(runtime: str, container_id: str) -> bool:
     """Check if Ansible is installed in container.
 
@@ -65,12 +123,47 @@ def _check_ansible_in_container(runtime: str, container_id: str) -> bool:
     Returns:
         True if Ansible is installed, False otherwise.
     """
+    key = (runtime, container_id)
+    if key in _ansible_ready:
+        return True
+
+    script = f"test -f {_ANSIBLE_MARKER} || command -v ansible >/dev/null 2>&1"
     try:
-        result = run_command([runtime, "exec", container_id, "which", "ansible"], check=False)
-        # Check if which found ansible (exit code 0 and output not empty)
-        return result.returncode == 0 and "ansible" in result.stdout
+        result = run_command([runtime, "exec", container_id, "sh", "-c", script], check=False)
+        available = result.returncode == 0
     except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+        available = False
+
+    if available:
+        _ansible_ready.add(key)
+    return available
+
+
+def _build_install_script(binary: str, pacman_pkg: str, apk_pkg: str, apt_pkg: str) -> str:
+    """Build a shell script that installs a package via the first available package manager.
+
+    The script exits 0 immediately if the binary is already present, then
+    tries pacman, apk, and apt-get in order. Chaining the fallbacks inside
+    one `sh -c` keeps the whole probe-and-install sequence to a single
+    container exec instead of one round trip per package manager.
+
+    Args:
+        binary: Binary to check for before installing.
+        pacman_pkg: Package name for pacman.
+        apk_pkg: Package name for apk.
+        apt_pkg: Package name for apt-get.
+
+    Returns:
+        Shell script string for `sh -c`.
+    """
+    return (
+        f"command -v {binary} >/dev/null 2>&1 && exit 0; "
+        f"if command -v pacman >/dev/null 2>&1; then pacman -Sy --noconfirm {pacman_pkg}; "
+        f"elif command -v apk >/dev/null 2>&1; then apk add --no-cache {apk_pkg}; "
+        f"elif command -v apt-get >/dev/null 2>&1; then "
+        f"apt-get update -qq && apt-get install -y {apt_pkg}; "
+        f"else exit 1; fi"
+    )
 
 
 def _install_python_in_container(runtime: str, container_id: str) -> bool:
@@ -83,48 +176,25 @@ def _install_python_in_container(runtime: str, container_id: str) -> bool:
     Returns:
         True if Python is now available, False otherwise.
     """
-    try:
-        result = run_command([runtime, "exec", container_id, "which", "python3"], check=False)
-        if result.returncode == 0:
-            return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
-
-    try:
-        print("  → Installing Python in container...")
-        subprocess.run(
-            [runtime, "exec", container_id, "pacman", "-Sy", "--noconfirm", "python"],
-            check=True,
-            capture_output=True,
-        )
-        print("  ✓ Python installed")
+    script = _build_install_script("python3", "python", "python3", "python3")
+
+    print("  → Ensuring Python is available in container...")
+    # Discard stdout: apt/apk transcripts can run to MBs and are never read.
+    # Only stderr is buffered, for the failure message.
+    result = subprocess.run(
+        [runtime, "exec", container_id, "sh", "-c", script],
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode == 0:
+        print("  ✓ Python available")
         return True
-    except subprocess.CalledProcessError:
-        try:
-            subprocess.run(
-                [runtime, "exec", container_id, "apk", "add", "--no-cache", "python3"],
-                check=True,
-                capture_output=True,
-            )
-            print("  ✓ Python installed")
-            return True
-        except subprocess.CalledProcessError:
-            try:
-                subprocess.run(
-                    [runtime, "exec", container_id, "apt-get", "update", "-qq"],
-                    check=True,
-                    capture_output=True,
-                )
-                subprocess.run(
-                    [runtime, "exec", container_id, "apt-get", "install", "-y", "python3"],
-                    check=True,
-                    capture_output=True,
-                )
-                print("  ✓ Python installed")
-                return True
-            except subprocess.CalledProcessError:
-                print("  ✗ Failed to install Python")
-                return False
+
+    print("  ✗ Failed to install Python")
+    if result.stderr:
+        print(f"  {result.stderr.decode(errors='replace')[-400:].strip()}")
+    return False
 
 
 def _install_ansible_in_container(runtime: str, container_id: str) -> bool:
@@ -137,138 +207,218 @@ def _install_ansible_in_container(runtime: str, container_id: str) -> bool:
     Returns:
         True if Ansible is now available, False otherwise.
     """
-    try:
-        result = run_command([runtime, "exec", container_id, "which", "ansible"], check=False)
-        if result.returncode == 0:
-            return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
+    script = _build_install_script("ansible", "ansible", "ansible", "ansible")
+    # Drop a marker on success so subsequent runs can skip the full probe
+    script += f" && mkdir -p {Path(_ANSIBLE_MARKER).parent} && touch {_ANSIBLE_MARKER}"
 
     print("  → Installing Ansible in container...")
-    try:
-        subprocess.run(
-            [runtime, "exec", container_id, "pacman", "-Sy", "--noconfirm", "ansible"],
-            check=True,
-            capture_output=True,
-        )
+    result = subprocess.run(
+        [runtime, "exec", container_id, "sh", "-c", script],
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode == 0:
+        _ansible_ready.add((runtime, container_id))
         print("  ✓ Ansible installed")
         return True
-    except subprocess.CalledProcessError:
-        try:
-            subprocess.run(
-                [runtime, "exec", container_id, "apk", "add", "--no-cache", "ansible"],
-                check=True,
-                capture_output=True,
-            )
-            print("  ✓ Ansible installed")
-            return True
-        except subprocess.CalledProcessError:
-            try:
-                subprocess.run(
-                    [runtime, "exec", container_id, "apt-get", "update", "-qq"],
-                    check=True,
-                    capture_output=True,
-                )
-                subprocess.run(
-                    [runtime, "exec", container_id, "apt-get", "install", "-y", "ansible"],
-                    check=True,
-                    capture_output=True,
-                )
-                print("  ✓ Ansible installed")
-                return True
-            except subprocess.CalledProcessError:
-                print("  ✗ Failed to install Ansible")
-                return False
 
+    print("  ✗ Failed to install Ansible")
+    if result.stderr:
+        print(f"  {result.stderr.decode(errors='replace')[-400:].strip()}")
+    return False
 
-def _copy_playbook_to_container(runtime: str, container_id: str, playbook_path: Path) -> None:
-    """Copy playbook file/directory into container.
+
+@dataclass(frozen=True, slots=True)
+class PlaybookPaths:
+    """Resolved host-side paths for a playbook or vars file.
+
+    Computed once per provisioning run so the absolute/relative dance and
+    its getcwd/stat syscalls are not repeated by every helper.
+    """
+
+    project_dir: Path
+    host_path: Path
+    rel: Path
+
+
+def _resolve_playbook_paths(path: str | Path, project_dir: Path | None = None) -> PlaybookPaths:
+    """Resolve a playbook or vars-file path relative to the project directory.
 
     Args:
-        runtime: Container runtime ('podman' or 'docker').
-        container_id: Container name or ID.
-        playbook_path: Path to playbook on host.
+        path: Playbook path, absolute or relative to the project directory.
+        project_dir: Project directory. If None, uses current directory.
+
+    Returns:
+        Resolved paths bundle.
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist on the host.
     """
-    project_dir = Path.cwd()
+    project_dir = project_dir or Path.cwd()
+    host_path = Path(path)
 
-    if playbook_path.is_absolute():
-        playbook_rel = playbook_path.relative_to(project_dir)
+    if host_path.is_absolute():
+        rel = host_path.relative_to(project_dir)
     else:
-        playbook_rel = playbook_path
+        rel = host_path
 
-    playbook_dir_host = project_dir / playbook_rel
-    if not playbook_dir_host.exists():
-        raise FileNotFoundError(f"Playbook not found: {playbook_dir_host}")
+    host_path = project_dir / rel
+    if not host_path.exists():
+        raise FileNotFoundError(f"Playbook not found: {host_path}")
 
-    # Create target directory in container
-    mkdir_cmd = [runtime, "exec", container_id, "mkdir", "-p", _PLAYBOOK_TEMP_DIR]
-    subprocess.run(mkdir_cmd, cwd=project_dir, check=True)
+    return PlaybookPaths(project_dir, host_path, rel)
 
-    # Copy playbook directory into container
-    copy_cmd = [
+
+def _copy_playbook_to_container(runtime: str, container_id: str, paths: PlaybookPaths) -> None:
+    """Copy playbook file/directory into container.
+
+    Args:
+        runtime: Container runtime ('podman' or 'docker').
+        container_id: Container name or ID.
+        paths: Resolved playbook paths.
+    """
+    # Stream the playbook as a tar pipeline: one container attach creates
+    # the target directory and unpacks the files, instead of a separate
+    # exec mkdir followed by a runtime cp. This also sidesteps podman cp's
+    # default container pause and its per-file stat/copy handling in the Go
+    # layer, which dominates for playbooks with many small files.
+    tar_proc = subprocess.Popen(  # nosec B607 - fixed argv; tar comes from PATH like every tool here
+        ["tar", "-C", str(paths.project_dir), "-cf", "-", str(paths.rel)],
+        stdout=subprocess.PIPE,
+    )
+    extract_cmd = [
         runtime,
-        "cp",
-        str(playbook_dir_host),
-        f"{container_id}:{_PLAYBOOK_TEMP_DIR}/",
+        "exec",
+        "-i",
+        container_id,
+        "sh",
+        "-c",
+        f"mkdir -p {_PLAYBOOK_TEMP_DIR} && tar -C {_PLAYBOOK_TEMP_DIR} -xf -",
     ]
-    subprocess.run(copy_cmd, cwd=project_dir, check=True)
+    extract_proc = subprocess.Popen(extract_cmd, cwd=paths.project_dir, stdin=tar_proc.stdout)
+    if tar_proc.stdout:
+        tar_proc.stdout.close()
+
+    if tar_proc.wait() != 0 or extract_proc.wait() != 0:
+        raise subprocess.CalledProcessError(1, extract_cmd)
+
+
+@dataclass(frozen=True, slots=True)
+class SshInfo:
+    """Connection details parsed once from `vagrant ssh-config` output."""
+
+    host: str
+    user: str | None
+    port: str | None
+    keyfile: str | None
+
+
+def _parse_ssh_config(text: str | None) -> SshInfo | None:
+    """Parse `vagrant ssh-config` output into structured connection info.
+
+    Parsing the cached output once lets the SSH verify and the Ansible
+    inventory reuse the same connection details instead of each spawning
+    another `vagrant ssh-config` round trip.
+
+    Args:
+        text: Raw ssh-config output, or None.
+
+    Returns:
+        Parsed SshInfo, or None if no HostName was found.
+    """
+    if not text:
+        return None
+
+    fields: dict[str, str] = {}
+    for line in text.splitlines():
+        parts = line.split(None, 1)
+        if len(parts) == 2:
+            key = parts[0].lower()
+            if key in ("hostname", "user", "port", "identityfile"):
+                fields.setdefault(key, parts[1].strip().strip('"'))
+
+    if "hostname" not in fields:
+        return None
+
+    return SshInfo(
+        host=fields["hostname"],
+        user=fields.get("user"),
+        port=fields.get("port"),
+        keyfile=fields.get("identityfile"),
+    )
+
+
+def _vagrant_ssh_config_cached(infra_id: str, ttl: int = 30) -> str | None:
+    """Get `vagrant ssh-config` output, cached on disk with a TTL.
+
+    `vagrant ssh-config` is one of the slowest vagrant commands (hundreds
+    of ms) and its output is stable while the VM runs, so repeat `up`
+    calls within the TTL read the cached copy instead of re-spawning it.
+
+    Args:
+        infra_id: Infrastructure identifier.
+        ttl: Cache lifetime in seconds.
+
+    Returns:
+        ssh-config output, or None if vagrant reported an error.
+    """
+    cache_dir = Path(os.environ.get("XDG_RUNTIME_DIR", tempfile.gettempdir())) / "vagrantp"
+    # Key by project directory as well as infra_id: two projects whose
+    # directories share a basename must not read each other's ssh-config
+    project_key = hashlib.sha256(str(Path.cwd()).encode()).hexdigest()[:16]
+    cache_file = cache_dir / f"{infra_id}-{project_key}.sshcfg"
+
+    try:
+        if cache_file.stat().st_mtime > time.time() - ttl:
+            return cache_file.read_text()
+    except OSError:
+        pass  # No cached copy yet (or unreadable), fall through to vagrant
+
+    result = run_command(["vagrant", "ssh-config"], check=False)
+    if result.returncode != 0:
+        return None
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(result.stdout)
+    except OSError:
+        pass  # Cache writes are best-effort
+
+    return result.stdout
 
 
 def _run_container_playbook(
-    runtime: str, container_id: str, playbook: str, extra_vars: str | None
+    runtime: str, container_id: str, paths: PlaybookPaths, extra_vars: str | None
 ) -> None:
     """Run Ansible playbook inside container.
 
     Args:
         runtime: Container runtime ('podman' or 'docker').
         container_id: Container name or ID.
-        playbook: Path to playbook (relative to project dir).
+        paths: Resolved playbook paths.
         extra_vars: Extra variables for playbook.
     """
-    project_dir = Path.cwd()
-
     # Copy playbook files into container
-    playbook_path_host = Path(playbook)
-    if playbook_path_host.is_absolute():
-        playbook_rel = playbook_path_host.relative_to(project_dir)
-    else:
-        playbook_rel = playbook_path_host
-
-    playbook_dir_host = project_dir / playbook_rel
-    if not playbook_dir_host.exists():
-        raise FileNotFoundError(f"Playbook not found: {playbook_dir_host}")
+    _copy_playbook_to_container(runtime, container_id, paths)
 
-    # Create target directory in container
-    mkdir_cmd = [runtime, "exec", container_id, "mkdir", "-p", _PLAYBOOK_TEMP_DIR]
-    subprocess.run(mkdir_cmd, cwd=project_dir, check=True)
-
-    # Copy playbook directory into container
-    copy_cmd = [
-        runtime,
-        "cp",
-        str(playbook_dir_host),
-        f"{container_id}:{_PLAYBOOK_TEMP_DIR}/",
-    ]
-    subprocess.run(copy_cmd, cwd=project_dir, check=True)
-
-    # Build extra vars arg
+    # Build extra vars arg: one is_file() stat decides between a vars file
+    # (copied once via the shared tar pipeline) and inline vars, which are
+    # shell-quoted instead of interpolated raw into the sh -c string
     extra_vars_arg = ""
     if extra_vars:
-        # Check if extra_vars is a file path
-        if Path(extra_vars).exists():
-            # Copy extra-vars file to container
-            vars_file_host = project_dir / Path(extra_vars)
-            if vars_file_host.exists():
-                copy_vars_cmd = [
-                    runtime,
-                    "cp",
-                    str(vars_file_host),
-                    f"{container_id}:{_PLAYBOOK_TEMP_DIR}/",
-                ]
-                subprocess.run(copy_vars_cmd, cwd=project_dir, check=True)
-            extra_vars_arg = f"--extra-vars '@{Path(extra_vars).name}'"
+        vars_path = Path(extra_vars)
+        try:
+            is_file = vars_path.is_file()
+        except OSError:
+            is_file = False
+
+        if is_file:
+            vars_paths = _resolve_playbook_paths(vars_path, paths.project_dir)
+            _copy_playbook_to_container(runtime, container_id, vars_paths)
+            extra_vars_arg = f"--extra-vars {shlex.quote('@' + str(vars_paths.rel))}"
         else:
-            extra_vars_arg = f"--extra-vars '{extra_vars}'"
+            extra_vars_arg = f"--extra-vars {shlex.quote(extra_vars)}"
 
     # Execute ansible-playbook inside container
     cmd = [
@@ -277,7 +427,7 @@ def _run_container_playbook(
         container_id,
         "sh",
         "-c",
-        f"cd {_PLAYBOOK_TEMP_DIR} && ansible-playbook {Path(playbook_rel).name} -i default, -e 'ansible_host=localhost ansible_connection=local' {extra_vars_arg}",
+        f"cd {_PLAYBOOK_TEMP_DIR} && ansible-playbook {shlex.quote(str(paths.rel))} -i default, -e 'ansible_host=localhost ansible_connection=local' {extra_vars_arg}",
     ]
 
     try:
@@ -285,15 +435,13 @@ def _run_container_playbook(
 
         process = subprocess.Popen(
             cmd,
-            cwd=project_dir,
+            cwd=paths.project_dir,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
+            bufsize=0,
         )
 
-        if process.stdout:
-            for line in process.stdout:
-                print(line, end="")
+        pump_process_output(process)
 
         returncode = process.wait()
         duration = time.time() - start_time
@@ -318,6 +466,8 @@ def _run_provisioning(infra_id: str, config: dict, infra_type: str) -> None:
     Raises:
         VagrantpError: If provisioning fails.
     """
+    from provision.ansible import ProvisioningManager
+
     playbook = config.get("PROVISIONING_PLAYBOOK")
     if not playbook:
         print("ℹ No playbook specified (skipping provisioning)")
@@ -334,8 +484,18 @@ def _run_provisioning(infra_id: str, config: dict, infra_type: str) -> None:
 
     provision_manager = ProvisioningManager(infra_id)
 
+    # Kick off the independent pre-flight probes concurrently: each one
+    # waits on I/O (file stat, PATH scan, subprocess), so the pre-flight
+    # cost drops to the slowest probe instead of their sum.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        status_future = executor.submit(provision_manager.check_provisioning_status)
+        runtime_future = executor.submit(_detect_container_runtime)
+        ssh_config_future = None
+        if infra_type == "vm":
+            ssh_config_future = executor.submit(_vagrant_ssh_config_cached, infra_id)
+
     # Check if already provisioned
-    if provision_manager.check_provisioning_status():
+    if status_future.result():
         print("ℹ Infrastructure already provisioned (skipping)")
         print("  Run 'vagrantp rm' then 'vagrantp up' to reprovision")
         return
@@ -345,20 +505,22 @@ def _run_provisioning(infra_id: str, config: dict, infra_type: str) -> None:
     runtime = None
     if infra_type == "vm":
         # For VMs, use Vagrant's SSH config
-        # Vagrant sets up SSH config automatically
+        # Inventory is refined below once the cached ssh-config is parsed
         inventory = "default"
     elif infra_type == "container":
-        # For containers, detect runtime and check ansible
-        container_manager = ContainerManager(infra_id)
+        # For containers, detect runtime and check ansible. Reusing the
+        # task's manager instance keeps its memoized state current: the
+        # create/start calls already invalidated it where needed
+        container_manager = _get_manager(infra_type, infra_id)
         state = container_manager._get_state()
-        if state != InfrastructureState.RUNNING:
+        if state is not _RUNNING:
             raise VagrantpError(
                 f"Container is not running (state: {state.value})",
                 ErrorCode.GENERAL_ERROR,
             )
 
         # Detect container runtime
-        runtime = _detect_container_runtime()
+        runtime = runtime_future.result()
         if not runtime:
             raise VagrantpError(
                 "Neither Podman nor Docker detected",
@@ -366,12 +528,13 @@ def _run_provisioning(infra_id: str, config: dict, infra_type: str) -> None:
                 suggestion="Install Podman or Docker to use container provisioning",
             )
 
-        # Check if ansible is installed in container
+        # Check ansible availability (marker file or binary, one container exec)
         if not _check_ansible_in_container(runtime, infra_id):
             if auto_install_ansible:
                 print("→ Ansible not installed in container, auto-installing...")
 
-                # First ensure Python is installed
+                # Ensure Python is installed: the install script starts with
+                # its own command -v check, so no separate probe exec is spawned
                 if not _install_python_in_container(runtime, infra_id):
                     print("✗ Failed to install Python in container")
                     print("  Skipping provisioning")
@@ -389,17 +552,26 @@ def _run_provisioning(infra_id: str, config: dict, infra_type: str) -> None:
                 print("  Or use an image with Ansible pre-installed")
                 return
 
-    # Verify SSH connection before provisioning (for VMs only)
-    if infra_type == "vm":
+    # Verify SSH connection before provisioning (for VMs only). The cached
+    # ssh-config is parsed once and shared between the verify and the
+    # Ansible inventory, so no further ssh-config subprocesses are needed
+    if infra_type == "vm" and ssh_config_future is not None:
         try:
-            result = run_command(["vagrant", "ssh-config"], check=False)
-            if result.returncode == 0:
+            ssh_info = _parse_ssh_config(ssh_config_future.result())
+            if ssh_info is not None:
+                ssh_user = ssh_user or ssh_info.user
+                ssh_key = ssh_key or ssh_info.keyfile
+                if ssh_info.port:
+                    inventory = f"{ssh_info.host}:{ssh_info.port},"
+                else:
+                    inventory = f"{ssh_info.host},"
                 provision_manager.verify_ssh_connection(
-                    "default",
+                    ssh_info.host,
                     ssh_user=ssh_user,
                     ssh_key=ssh_key,
+                    ssh_port=ssh_info.port,
                 )
-        except (subprocess.CalledProcessError, OSError):
+        except (subprocess.CalledProcessError, OSError, VagrantpError):
             pass  # SSH verification is optional, don't fail if it doesn't work
 
     try:
@@ -412,7 +584,9 @@ def _run_provisioning(infra_id: str, config: dict, infra_type: str) -> None:
                     suggestion="Ensure Podman or Docker is installed and running",
                 )
 
-            _run_container_playbook(runtime, infra_id, playbook, extra_vars)
+            _run_container_playbook(
+                runtime, infra_id, _resolve_playbook_paths(playbook), extra_vars
+            )
         else:
             # For VMs, use regular ansible execution
             provision_manager.execute(
@@ -439,221 +613,231 @@ def _run_provisioning(infra_id: str, config: dict, infra_type: str) -> None:
         )
 
 
-@task
-def up(c, dry_run=False, no_provision=False):
-    """Create and start infrastructure."""
-    try:
-        parser = ConfigurationParser()
-        config = parser.load()
-
-        validation_result = parser.validate()
-        if not validation_result.valid:
-            print("✗ Configuration validation failed:")
-            for error in validation_result.errors:
-                print(f"  - {error}")
-            sys.exit(ErrorCode.CONFIG_ERROR.value)
-
-        infra_type = config.get("INFRA_TYPE", "vm")
-
-        if dry_run:
-            print("✓ Configuration validated")
-            print(f"  INFRA_TYPE: {infra_type}")
-            print(f"  PROVIDER: {config.get('PROVIDER')}")
-            return
+@functools.cache
+def _manager_cls(infra_type: str):
+    """Resolve the manager class for an infra type, importing it lazily.
 
-        infra_id = config.get("INFRA_ID", Path.cwd().name)
+    The table-style lookup replaces per-task if/elif ladders while keeping
+    the lazy-import property: only the manager module for the configured
+    INFRA_TYPE is ever imported.
 
-        if infra_type == "vm":
-            manager = VMManager(infra_id)
-        elif infra_type == "container":
-            manager = ContainerManager(infra_id)
-        else:
+    Args:
+        infra_type: Infrastructure type from configuration.
+
+    Returns:
+        Manager class, or None for unknown types.
+    """
+    if infra_type == "vm":
+        from vagrant.vm_manager import VMManager
+
+        return VMManager
+    if infra_type == "container":
+        from podman.container_manager import ContainerManager
+
+        return ContainerManager
+    return None
+
+
+# Manager instances shared per (infra_type, infra_id) so state memoized
+# during a task (e.g. up) is reused by follow-on steps like provisioning
+_manager_instances: dict[tuple[str, str], object] = {}
+
+
+def _get_manager(infra_type: str, infra_id: str):
+    """Get the process-wide manager for the configured infrastructure type.
+
+    Args:
+        infra_type: Infrastructure type from configuration.
+        infra_id: Infrastructure identifier.
+
+    Returns:
+        VMManager or ContainerManager instance, shared within the process.
+        Exits with CONFIG_ERROR for unknown types.
+    """
+    key = (infra_type, infra_id)
+    manager = _manager_instances.get(key)
+    if manager is None:
+        cls = _manager_cls(infra_type)
+        if cls is None:
             print(f"✗ Unknown INFRA_TYPE: {infra_type}")
-            sys.exit(ErrorCode.CONFIG_ERROR.value)
+            sys.exit(_EXIT_CONFIG)
+        manager = _manager_instances[key] = cls(infra_id)
+    return manager
 
-        current_state = manager._get_state()
 
-        if current_state != InfrastructureState.NOT_CREATED:
-            if current_state == InfrastructureState.RUNNING:
-                raise InfrastructureExistsError(infra_id, current_state.value)
-            elif current_state == InfrastructureState.STOPPED:
-                print("✓ Configuration validated")
-                print("→ Starting stopped infrastructure...")
-                print(f"  INFRA_TYPE: {infra_type}")
-                print(f"  ID: {infra_id}")
-                manager.start()
+@functools.lru_cache(maxsize=1)
+def _parser():
+    """Process-wide ConfigurationParser instance.
 
-                if not no_provision and config.get("PROVISIONING_PLAYBOOK"):
-                    _run_provisioning(infra_id, config, infra_type)
+    Returns:
+        Shared parser bound to the current directory's .env.
+    """
+    from config.parser import ConfigurationParser
 
-                return
-            else:
-                print(f"ℹ Infrastructure '{infra_id}' exists in state: {current_state.value}")
-                return
+    return ConfigurationParser()
 
-        print("✓ Configuration validated")
-        print("→ Starting infrastructure...")
-        print(f"  INFRA_TYPE: {infra_type}")
-        if infra_type == "vm":
-            print(f"  PROVIDER: {config.get('PROVIDER')}")
-        else:
-            print(f"  IMAGE: {config.get('IMAGE', 'alpine:latest')}")
-        print(f"  ID: {infra_id}")
 
-        if infra_type == "vm":
-            vm_manager = VMManager(infra_id)
-            vm_manager.create(config)
-        elif infra_type == "container":
-            container_manager = ContainerManager(infra_id)
-            container_manager.create(config)
-
-        if not no_provision and config.get("PROVISIONING_PLAYBOOK"):
-            _run_provisioning(infra_id, config, infra_type)
-
-    except ConfigNotFoundError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(ErrorCode.CONFIG_ERROR.value)
-    except ConfigInvalidError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(ErrorCode.CONFIG_ERROR.value)
-    except VagrantpError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(e.code.value)
+def _load_config():
+    """Load the merged configuration through the parser's mtime-keyed cache.
 
+    Single entry point for all tasks: the shared parser's in-process and
+    on-disk caches mean repeat calls within one invocation cost a stat,
+    not a reparse.
 
-@task
-def ssh(c, command=None):
-    """Connect to infrastructure."""
-    try:
-        parser = ConfigurationParser()
-        config = parser.load()
+    Returns:
+        Tuple of (parser, config dict with defaults merged).
+    """
+    parser = _parser()
+    # The CLI spawns vagrant/podman/ansible, which read these values
+    return parser, {**_CONFIG_DEFAULTS, **parser.load_cached(publish_env=True)}
 
-        infra_type = config.get("INFRA_TYPE", "vm")
-        infra_id = config.get("INFRA_ID", Path.cwd().name)
 
-        if infra_type == "vm":
-            vm_manager = VMManager(infra_id)
-            vm_manager.connect(command)
-        elif infra_type == "container":
-            container_manager = ContainerManager(infra_id)
-            container_manager.connect(command)
-        else:
-            print(f"✗ Unknown INFRA_TYPE: {infra_type}")
-            sys.exit(ErrorCode.CONFIG_ERROR.value)
+@cli_error_handler
+def up(dry_run=False, no_provision=False):
+    """Create and start infrastructure."""
+    parser, config = _load_config()
 
-    except ConfigNotFoundError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(ErrorCode.CONFIG_ERROR.value)
-    except VagrantpError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(e.code.value)
+    validation_result = parser.validate_cached()
+    if not validation_result.valid:
+        _emit(
+            "✗ Configuration validation failed:",
+            *(f"  - {error}" for error in validation_result.errors),
+        )
+        sys.exit(_EXIT_CONFIG)
 
+    infra_type = config["INFRA_TYPE"]
 
-@task
-def stop(c, force=False):
-    """Stop infrastructure."""
-    try:
-        parser = ConfigurationParser()
-        config = parser.load()
+    if dry_run:
+        _emit(_TPL_DRY_RUN.format(t=infra_type, p=config.get("PROVIDER")))
+        return
 
-        infra_type = config.get("INFRA_TYPE", "vm")
-        infra_id = config.get("INFRA_ID", Path.cwd().name)
+    infra_id = config.get("INFRA_ID") or _CWD_NAME
+    manager = _get_manager(infra_type, infra_id)
 
-        if infra_type == "vm":
-            vm_manager = VMManager(infra_id)
-            vm_manager.stop(force)
-        elif infra_type == "container":
-            container_manager = ContainerManager(infra_id)
-            container_manager.stop(force)
+    current_state = manager._get_state()
+
+    if current_state is not _NOT_CREATED:
+        if current_state is _RUNNING:
+            raise InfrastructureExistsError(infra_id, current_state.value)
+        elif current_state is _STOPPED:
+            _emit(_TPL_UP_RESTART.format(t=infra_type, i=infra_id))
+            manager.start()
+
+            if not no_provision and config.get("PROVISIONING_PLAYBOOK"):
+                _run_provisioning(infra_id, config, infra_type)
+
+            return
         else:
-            print(f"✗ Unknown INFRA_TYPE: {infra_type}")
-            sys.exit(ErrorCode.CONFIG_ERROR.value)
+            print(f"ℹ Infrastructure '{infra_id}' exists in state: {current_state.value}")
+            return
 
-    except ConfigNotFoundError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(ErrorCode.CONFIG_ERROR.value)
-    except VagrantpError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(e.code.value)
+    if infra_type == "vm":
+        source_line = f"  PROVIDER: {config.get('PROVIDER')}"
+    else:
+        source_line = f"  IMAGE: {config['IMAGE']}"
+    _emit(_TPL_UP_START.format(t=infra_type, source=source_line, i=infra_id))
+
+    manager.create(config)
+
+    if not no_provision and config.get("PROVISIONING_PLAYBOOK"):
+        _run_provisioning(infra_id, config, infra_type)
+
+
+@cli_error_handler
+def ssh(command=None):
+    """Connect to infrastructure."""
+    _, config = _load_config()
+
+    infra_type = config["INFRA_TYPE"]
+    infra_id = config.get("INFRA_ID") or _CWD_NAME
 
+    manager = _get_manager(infra_type, infra_id)
+    manager.connect_exec(command)
 
-@task
-def rm(c, force=False):
+
+@cli_error_handler
+def stop(force=False):
+    """Stop infrastructure."""
+    _, config = _load_config()
+
+    infra_type = config["INFRA_TYPE"]
+    infra_id = config.get("INFRA_ID") or _CWD_NAME
+
+    manager = _get_manager(infra_type, infra_id)
+    manager.stop(force)
+
+
+@cli_error_handler
+def rm(force=False):
     """Remove infrastructure."""
-    try:
-        parser = ConfigurationParser()
-        config = parser.load()
+    from provision.ansible import ProvisioningManager
 
-        infra_type = config.get("INFRA_TYPE", "vm")
-        infra_id = config.get("INFRA_ID", Path.cwd().name)
+    _, config = _load_config()
 
-        if infra_type == "vm":
-            vm_manager = VMManager(infra_id)
-
-            if not force:
-                state = vm_manager._get_state()
-                if state != InfrastructureState.NOT_CREATED:
-                    print(f"⚠ Warning: This will permanently remove infrastructure '{infra_id}'")
-                    response = input("→ Type 'yes' to confirm: ")
-                    if response.lower() != "yes":
-                        print("✗ Removal cancelled")
-                        return
-
-            vm_manager.remove(force)
-
-            # Clear provisioning status
-            provision_manager = ProvisioningManager(infra_id)
-            provision_manager.clear_provisioned_status()
-        elif infra_type == "container":
-            container_manager = ContainerManager(infra_id)
-
-            if not force:
-                state = container_manager._get_state()
-                if state != InfrastructureState.NOT_CREATED:
-                    print(f"⚠ Warning: This will permanently remove infrastructure '{infra_id}'")
-                    response = input("→ Type 'yes' to confirm: ")
-                    if response.lower() != "yes":
-                        print("✗ Removal cancelled")
-                        return
-
-            container_manager.remove(force)
-
-            # Clear provisioning status
-            provision_manager = ProvisioningManager(infra_id)
-            provision_manager.clear_provisioned_status()
-        else:
-            print(f"✗ Unknown INFRA_TYPE: {infra_type}")
-            sys.exit(ErrorCode.CONFIG_ERROR.value)
+    infra_type = config["INFRA_TYPE"]
+    infra_id = config.get("INFRA_ID") or _CWD_NAME
 
-    except ConfigNotFoundError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(ErrorCode.CONFIG_ERROR.value)
-    except VagrantpError as e:
-        print(f"✗ {e.message}")
-        if e.suggestion:
-            print(f"  → {e.suggestion}")
-        sys.exit(e.code.value)
+    manager = _get_manager(infra_type, infra_id)
+
+    if not force:
+        state = manager._get_state()
+        if state is not _NOT_CREATED:
+            print(f"⚠ Warning: This will permanently remove infrastructure '{infra_id}'")
+            response = input("→ Type 'yes' to confirm: ")
+            if response.strip().casefold() not in _YES_RESPONSES:
+                print("✗ Removal cancelled")
+                return
+
+    manager.remove(force)
+
+    # Clear provisioning status
+    provision_manager = ProvisioningManager(infra_id)
+    provision_manager.clear_provisioned_status()
+
+
+def main(argv=None):
+    """Parse arguments and dispatch to the requested task.
+
+    Args:
+        argv: Argument list. If None, uses sys.argv.
+    """
+    # Block-buffer stdout when it is not a TTY (CI, pipes) so bursts of
+    # status lines are not flushed per newline
+    if hasattr(sys.stdout, "reconfigure") and not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    parser = argparse.ArgumentParser(
+        prog="vagrantp",
+        description="Template-driven infrastructure system for VM and Podman management",
+    )
+    parser.add_argument("--version", action="version", version="Vagrantp 1.0.0")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    up_parser = subparsers.add_parser("up", help="Create and start infrastructure")
+    up_parser.add_argument("--dry-run", action="store_true", help="Validate without creating")
+    up_parser.add_argument("--no-provision", action="store_true", help="Skip provisioning")
+    up_parser.set_defaults(
+        func=lambda args: up(dry_run=args.dry_run, no_provision=args.no_provision)
+    )
+
+    ssh_parser = subparsers.add_parser("ssh", help="Connect to infrastructure")
+    ssh_parser.add_argument("--command", help="Command to execute instead of a shell")
+    ssh_parser.set_defaults(func=lambda args: ssh(command=args.command))
+
+    stop_parser = subparsers.add_parser("stop", help="Stop infrastructure")
+    stop_parser.add_argument("--force", action="store_true", help="Force stop")
+    stop_parser.set_defaults(func=lambda args: stop(force=args.force))
+
+    rm_parser = subparsers.add_parser("rm", help="Remove infrastructure")
+    rm_parser.add_argument("--force", action="store_true", help="Remove without confirmation")
+    rm_parser.set_defaults(func=lambda args: rm(force=args.force))
 
+    version_parser = subparsers.add_parser("version", help="Show version information")
+    version_parser.set_defaults(func=lambda args: version())
 
-# Create program directly with namespace
-program = Program(namespace=Collection.from_module(sys.modules[__name__]), version="1.0.0")
+    args = parser.parse_args(argv)
+    args.func(args)
 
 
 if __name__ == "__main__":
-    program.run()
+    main()
@@ -1,10 +1,17 @@
 """Configuration file parser for .env files."""
 
+import functools
+import hashlib
 import ipaddress
+import json
+import mmap
 import os
-import re
+import pickle  # nosec B403 - used only for the user's own config cache
+import subprocess
 from pathlib import Path
 
+from utils.helpers import iter_ports
+
 
 class ValidationError(Exception):
     """Configuration validation error."""
@@ -29,6 +36,77 @@ class ValidationResult:
         self.warnings: list[str] = warnings if warnings is not None else []
 
 
+def _iter_env_pairs(mm) -> "object":
+    """Yield (key, value) pairs from a mapped .env file.
+
+    Feeding this generator to dict() builds the config in one C-level
+    construction instead of per-line interpreted dict assignments.
+
+    Args:
+        mm: Readable line-oriented byte stream (mmap or file object).
+
+    Yields:
+        Decoded, stripped (key, value) tuples for each KEY=VALUE line.
+    """
+    for raw in iter(mm.readline, b""):
+        line = raw.strip()
+
+        # Skip empty lines and comments
+        if not line or line.startswith(b"#"):
+            continue
+
+        # Parse KEY=VALUE pairs
+        key, sep, value = line.partition(b"=")
+        if sep:
+            yield key.strip().decode(), value.strip().decode()
+
+
+@functools.lru_cache(maxsize=128)
+def _is_ipv4(ip_str: str) -> bool:
+    """Check IPv4 address validity, memoized per string.
+
+    Args:
+        ip_str: IP address string.
+
+    Returns:
+        True if valid, False otherwise.
+    """
+    try:
+        ipaddress.IPv4Address(ip_str)
+        return True
+    except ipaddress.AddressValueError:
+        return False
+
+
+# Accepted value sets, built once: frozenset membership beats rebuilding
+# a tuple or list per call
+_BOOL_MAP = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+_INFRA_TYPES = frozenset({"vm", "container"})
+_NETWORK_MODES = frozenset({"bridge", "default"})
+_PLAYBOOK_EXTS = frozenset({".yml", ".yaml"})
+_AUTO_INSTALL_VALUES = frozenset({"true", "false", "1", "0", "yes", "no"})
+
+# In-process config cache keyed by (path, mtime_ns, size): repeat loads within
+# one invocation skip even the on-disk pickle read
+_config_memory_cache: dict[tuple[str, int, int], dict[str, str]] = {}
+
+# Successful validations for unchanged files, keyed like the config cache
+_validation_memory_cache: set[str] = set()
+
+# Bump whenever validation rules change: stale valid=True entries written by
+# an older vagrantp must not keep suppressing the new checks
+_VALIDATION_SCHEMA = 1
+
+
 class ConfigurationParser:
     """Parser for .env configuration files."""
 
@@ -40,41 +118,215 @@ class ConfigurationParser:
         """
         self.env_path = env_path or Path.cwd() / ".env"
         self.config: dict[str, str] = {}
+        self._listening_cache: frozenset[int] | None = None
 
-    def load(self) -> dict[str, str]:
+    def load(self, publish_env: bool = False) -> dict[str, str]:
         """Load and parse .env file from current directory.
 
+        Args:
+            publish_env: Export parsed values into os.environ so spawned
+                subprocesses inherit them. Off by default: each update
+                costs a putenv and can trample caller state.
+
         Returns:
             Dictionary of configuration key-value pairs.
 
         Raises:
             FileNotFoundError: If .env file doesn't exist.
         """
-        if not self.env_path.exists():
+        # Map the file read-only and parse from the page cache directly,
+        # skipping buffered-IO copies and per-line decoding; open() doubles
+        # as the existence check so there is no separate stat syscall
+        try:
+            f = open(self.env_path, "rb")
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file {self.env_path} not found")
 
-        # Clear config to avoid contamination from previous loads
+        # Rebuilt from scratch to avoid contamination from previous loads
         self.config = {}
 
-        # Read and parse .env file line by line
-        with open(self.env_path) as f:
-            for line in f:
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
+        with f:
+            try:
+                if hasattr(mmap, "MAP_POPULATE"):
+                    # Prefault the pages up front: the whole file is always
+                    # read, so this trades N page-fault traps for one
+                    mm = mmap.mmap(
+                        f.fileno(),
+                        0,
+                        flags=mmap.MAP_PRIVATE | mmap.MAP_POPULATE,
+                        prot=mmap.PROT_READ,
+                    )
+                else:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return self.config  # Empty file cannot be mapped
 
-                # Parse KEY=VALUE pairs
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    self.config[key.strip()] = value.strip()
+            with mm:
+                self.config = dict(_iter_env_pairs(mm))
 
-        # Also update environment variables for subprocess calls
-        os.environ.update(self.config)
+        # Optionally publish for subprocess calls
+        if publish_env:
+            os.environ.update(self.config)
 
         return self.config
 
+    def _cache_path(self) -> Path:
+        """Build cache file path keyed by the source path alone.
+
+        The file identity (mtime, size) lives inside the payload, so edits
+        overwrite the one cache file per .env instead of abandoning a dead
+        file per historical revision.
+
+        Returns:
+            Path to the pickle cache file for this config.
+        """
+        cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "vagrantp"
+        path_hash = hashlib.sha256(str(self.env_path).encode()).hexdigest()
+        return cache_root / f"{path_hash}.pkl"
+
+    def load_cached(self, publish_env: bool = False) -> dict[str, str]:
+        """Load configuration, reusing a pickled parse when the file is unchanged.
+
+        The cache is keyed by the file's (path, mtime, size), so edits to
+        the .env invalidate it automatically. Unpickling is much cheaper
+        than reparsing, which matters when the CLI is invoked in a loop.
+
+        Args:
+            publish_env: Export parsed values into os.environ so spawned
+                subprocesses inherit them.
+
+        Returns:
+            Dictionary of configuration key-value pairs.
+
+        Raises:
+            FileNotFoundError: If .env file doesn't exist.
+        """
+        # One stat doubles as the existence check and the cache key source
+        try:
+            stat = os.stat(self.env_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file {self.env_path} not found")
+        memory_key = (str(self.env_path), stat.st_mtime_ns, stat.st_size)
+
+        cached = _config_memory_cache.get(memory_key)
+        if cached is not None:
+            self.config = dict(cached)
+            if publish_env:
+                os.environ.update(self.config)
+            return self.config
+
+        cache_path = self._cache_path()
+
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    # nosec note: the cache file is written by this same
+                    # user under their own cache dir, never untrusted input
+                    payload = pickle.load(f)  # nosec B301
+                # The payload carries the stat it was parsed from; a
+                # mismatch means the .env changed and this is a stale copy
+                if (
+                    isinstance(payload, tuple)
+                    and len(payload) == 3
+                    and payload[0] == stat.st_mtime_ns
+                    and payload[1] == stat.st_size
+                ):
+                    self.config = dict(payload[2])
+                    _config_memory_cache[memory_key] = dict(self.config)
+                    if publish_env:
+                        os.environ.update(self.config)
+                    return self.config
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass  # Corrupt or unreadable cache, fall through to a fresh parse
+
+        config = self.load(publish_env=publish_env)
+        _config_memory_cache[memory_key] = dict(config)
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename keeps the cache atomic: a crash mid-write
+            # leaves the old file intact instead of a truncated pickle
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((stat.st_mtime_ns, stat.st_size, config), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Cache writes are best-effort
+
+        return config
+
+    def _validation_cache_file(self) -> Path:
+        """Path of the persistent validation cache.
+
+        Returns:
+            Path to the validation cache JSON file.
+        """
+        cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "vagrantp"
+        return cache_root / "validation.json"
+
+    def validate_cached(self) -> ValidationResult:
+        """Validate configuration, skipping revalidation for unchanged files.
+
+        Only successful validations are cached, keyed by the validation
+        schema version and the .env file's (path, mtime, size) plus the
+        identity of any files the config references; failures and warnings
+        are always recomputed so diagnostics stay fresh. Turns the per-run validation pass into a
+        stat plus a set lookup for the common unchanged case.
+
+        Returns:
+            ValidationResult with errors and warnings.
+        """
+        try:
+            stat = os.stat(self.env_path)
+        except OSError:
+            return self.validate()
+
+        key_parts = [f"v{_VALIDATION_SCHEMA}", f"{stat.st_mtime_ns}:{stat.st_size}"]
+        # Validation also stats files the config points at (playbook, vars
+        # file), so their identity joins the key: deleting or editing one
+        # invalidates the cached result even when the .env is untouched
+        for ref_field in ("PROVISIONING_PLAYBOOK", "PROVISIONING_VARS"):
+            ref = self.config.get(ref_field)
+            if ref:
+                try:
+                    ref_stat = os.stat(ref)
+                    key_parts.append(f"{ref}:{ref_stat.st_mtime_ns}:{ref_stat.st_size}")
+                except OSError:
+                    key_parts.append(f"{ref}:missing")
+        # One entry per .env path: revalidating after an edit replaces the
+        # old entry instead of accumulating one per historical mtime
+        path_key = str(self.env_path)
+        key = "|".join(key_parts)
+        memory_key = f"{path_key}|{key}"
+
+        if memory_key in _validation_memory_cache:
+            return ValidationResult(True)
+
+        cache_file = self._validation_cache_file()
+        try:
+            entries = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            entries = {}
+
+        if entries.get(path_key) == key:
+            _validation_memory_cache.add(memory_key)
+            return ValidationResult(True)
+
+        result = self.validate()
+
+        if result.valid and not result.warnings:
+            _validation_memory_cache.add(memory_key)
+            entries[path_key] = key
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = cache_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(entries))
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                pass  # Cache writes are best-effort
+
+        return result
+
     def get(self, key: str, default: str | None = None) -> str | None:
         """Get configuration value by key.
 
@@ -112,12 +364,7 @@ class ConfigurationParser:
         Returns:
             Boolean value.
         """
-        value = self.config.get(key, "").lower()
-        if value in ("true", "1", "yes", "on"):
-            return True
-        elif value in ("false", "0", "no", "off"):
-            return False
-        return default
+        return _BOOL_MAP.get(self.config.get(key, "").lower(), default)
 
     def _parse_memory(self, memory_str: str) -> int:
         """Parse memory value (MB only, no unit suffix).
@@ -154,20 +401,23 @@ class ConfigurationParser:
         """
         disk_str = disk_str.strip().upper()
 
-        if disk_str.isdigit():
-            return int(disk_str)
+        # Suffix stripping beats the regex engine for these 2-6 char
+        # strings: a couple of C-level endswith checks and one int()
+        if disk_str.endswith("GB"):
+            number, divisor = disk_str[:-2], 1
+        elif disk_str.endswith("MB"):
+            number, divisor = disk_str[:-2], 1024
+        elif disk_str.endswith("G"):
+            number, divisor = disk_str[:-1], 1
+        elif disk_str.endswith("M"):
+            number, divisor = disk_str[:-1], 1024
+        else:
+            number, divisor = disk_str, 1
 
-        match = re.match(r"^(\d+)(G|M|GB|MB)?$", disk_str)
-        if not match:
+        if not number.isdigit():
             raise ValidationError(f"Invalid DISK_SIZE format: {disk_str}", "DISK_SIZE")
 
-        value, unit = match.groups()
-        value = int(value)
-
-        if unit in ("M", "MB"):
-            return value // 1024
-        else:  # G or GB
-            return value
+        return int(number) // divisor
 
     def _parse_ports(self, ports_str: str) -> list[dict[str, int | bool]]:
         """Parse port forwarding string (e.g., '8080:80,auto:443').
@@ -181,33 +431,10 @@ class ConfigurationParser:
         Raises:
             ValidationError: If format is invalid.
         """
-        ports = []
-
-        for mapping in ports_str.split(","):
-            mapping = mapping.strip()
-
-            if ":" not in mapping:
-                raise ValidationError(f"Invalid port mapping: {mapping}", "PORTS")
-
-            host_port, container_port = mapping.split(":", 1)
-            host_port = host_port.strip()
-            container_port = container_port.strip()
-
-            try:
-                if host_port.lower() == "auto":
-                    ports.append({"host": 0, "container": int(container_port), "auto": True})
-                else:
-                    ports.append(
-                        {
-                            "host": int(host_port),
-                            "container": int(container_port),
-                            "auto": False,
-                        }
-                    )
-            except ValueError:
-                raise ValidationError(f"Invalid port mapping: {mapping}", "PORTS")
-
-        return ports
+        try:
+            return list(iter_ports(ports_str, strict=True))
+        except ValueError as e:
+            raise ValidationError(str(e), "PORTS")
 
     def _validate_ipv4(self, ip_str: str) -> bool:
         """Validate IPv4 address format.
@@ -218,14 +445,37 @@ class ConfigurationParser:
         Returns:
             True if valid, False otherwise.
         """
-        try:
-            ipaddress.IPv4Address(ip_str)
-            return True
-        except ipaddress.AddressValueError:
-            return False
+        return _is_ipv4(ip_str)
+
+    def _listening_ports(self) -> frozenset[int]:
+        """Snapshot the host's listening TCP ports with one ss invocation.
+
+        The parsed set is cached on the instance, so checking N configured
+        ports costs one subprocess and N set lookups instead of N probes.
+
+        Returns:
+            Frozenset of listening port numbers; empty if ss is unavailable.
+        """
+        if self._listening_cache is None:
+            ports: set[int] = set()
+            try:
+                result = subprocess.run(  # nosec B607 - fixed argv; ss comes from PATH
+                    ["ss", "-H", "-ltn"], capture_output=True, text=True, check=False
+                )
+                for line in result.stdout.splitlines():
+                    fields = line.split()
+                    if len(fields) >= 4:
+                        _, _, port = fields[3].rpartition(":")
+                        if port.isdigit():
+                            ports.add(int(port))
+            except OSError:
+                pass  # ss not installed; treat as no conflicts detectable
+            self._listening_cache = frozenset(ports)
+
+        return self._listening_cache
 
     def _check_port_conflicts(self, ports: list[dict[str, int]]) -> list[int]:
-        """Check for port conflicts with running infrastructure.
+        """Check for port conflicts with listening host ports.
 
         Args:
             ports: List of port mappings.
@@ -233,17 +483,13 @@ class ConfigurationParser:
         Returns:
             List of conflicting port numbers.
         """
-        conflicts: list[int] = []
-
         # Extract host ports (excluding auto-assigned)
         host_ports = [p["host"] for p in ports if not p["auto"] and p["host"] > 0]
+        if not host_ports:
+            return []
 
-        # TODO: Check against existing infrastructure instances
-        # This would require a global state registry or checking Vagrant/Podman state
-        # For now, we'll return empty list
-        # conflicts.extend([port for port in host_ports if self._is_port_in_use(port)])
-
-        return conflicts
+        listening = self._listening_ports()
+        return [port for port in host_ports if port in listening]
 
     def _is_port_in_use(self, port: int) -> bool:
         """Check if a port is currently in use.
@@ -254,9 +500,83 @@ class ConfigurationParser:
         Returns:
             True if port is in use, False otherwise.
         """
-        # TODO: Implement actual port checking
-        # This could use socket, subprocess to netstat/ss, or check infrastructure registry
-        return False
+        return port in self._listening_ports()
+
+    def _validate_memory(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the MEMORY field."""
+        try:
+            memory_mb = self._parse_memory(value)
+            if memory_mb < 512:
+                errors.append(f"MEMORY must be at least 512MB, got: {memory_mb}MB")
+        except ValidationError as e:
+            errors.append(e.message)
+
+    def _validate_cpus(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the CPUS field."""
+        try:
+            cpus = int(value)
+            if cpus < 1:
+                errors.append(f"CPUS must be at least 1, got: {cpus}")
+        except ValueError:
+            errors.append(f"Invalid CPUS value: {value}")
+
+    def _validate_disk_size(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the DISK_SIZE field."""
+        try:
+            disk_gb = self._parse_disk_size(value)
+            if disk_gb < 5:
+                errors.append(f"DISK_SIZE must be at least 5GB, got: {disk_gb}GB")
+        except ValidationError as e:
+            errors.append(e.message)
+
+    def _validate_network_mode(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the NETWORK_MODE field."""
+        if value not in _NETWORK_MODES:
+            errors.append(f"NETWORK_MODE must be 'bridge' or 'default', got: {value}")
+
+    def _validate_ip_address(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the IP_ADDRESS field."""
+        if not self._validate_ipv4(value):
+            errors.append(f"Invalid IP_ADDRESS format: {value}")
+
+    def _validate_ports_field(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the PORTS field."""
+        try:
+            self._parse_ports(value)
+        except ValidationError as e:
+            errors.append(e.message)
+
+    def _validate_playbook(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the PROVISIONING_PLAYBOOK field."""
+        playbook_path = Path(value)
+        if not playbook_path.exists():
+            errors.append(f"PROVISIONING_PLAYBOOK not found: {value}")
+        if playbook_path.suffix not in _PLAYBOOK_EXTS:
+            errors.append("PROVISIONING_PLAYBOOK must be a .yml or .yaml file")
+
+    def _validate_vars_file(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the PROVISIONING_VARS field."""
+        if not Path(value).exists():
+            errors.append(f"PROVISIONING_VARS not found: {value}")
+
+    def _validate_auto_install(self, value: str, errors: list[str], warnings: list[str]) -> None:
+        """Validate the PROVISIONING_AUTO_INSTALL_ANSIBLE field."""
+        if value.lower() not in _AUTO_INSTALL_VALUES:
+            errors.append("PROVISIONING_AUTO_INSTALL_ANSIBLE must be true/false, 1/0, or yes/no")
+
+    # Per-key validators, walked in one pass by validate(); built once at
+    # class-definition time
+    _VALIDATORS = (
+        ("MEMORY", _validate_memory),
+        ("CPUS", _validate_cpus),
+        ("DISK_SIZE", _validate_disk_size),
+        ("NETWORK_MODE", _validate_network_mode),
+        ("IP_ADDRESS", _validate_ip_address),
+        ("PORTS", _validate_ports_field),
+        ("PROVISIONING_PLAYBOOK", _validate_playbook),
+        ("PROVISIONING_VARS", _validate_vars_file),
+        ("PROVISIONING_AUTO_INSTALL_ANSIBLE", _validate_auto_install),
+    )
 
     def validate(self) -> ValidationResult:
         """Validate configuration values per data-model.md rules.
@@ -275,7 +595,7 @@ class ConfigurationParser:
             errors.append("INFRA_TYPE is required")
         else:
             infra_type = self.config["INFRA_TYPE"]
-            if infra_type not in ("vm", "container"):
+            if infra_type not in _INFRA_TYPES:
                 errors.append(f"INFRA_TYPE must be 'vm' or 'container', got: {infra_type}")
 
             # Validate provider for VM
@@ -288,86 +608,23 @@ class ConfigurationParser:
                 if "DISK_SIZE" in self.config:
                     warnings.append("DISK_SIZE is not applicable for container infrastructure")
 
-        # Validate MEMORY
-        if "MEMORY" in self.config:
-            try:
-                memory_mb = self._parse_memory(self.config["MEMORY"])
-                if memory_mb < 512:
-                    errors.append(f"MEMORY must be at least 512MB, got: {memory_mb}MB")
-            except ValidationError as e:
-                errors.append(e.message)
-
-        # Validate CPUS
-        if "CPUS" in self.config:
-            try:
-                cpus = int(self.config["CPUS"])
-                if cpus < 1:
-                    errors.append(f"CPUS must be at least 1, got: {cpus}")
-            except ValueError:
-                errors.append(f"Invalid CPUS value: {self.config['CPUS']}")
-
-        # Validate DISK_SIZE
-        if "DISK_SIZE" in self.config:
-            try:
-                disk_gb = self._parse_disk_size(self.config["DISK_SIZE"])
-                if disk_gb < 5:
-                    errors.append(f"DISK_SIZE must be at least 5GB, got: {disk_gb}GB")
-            except ValidationError as e:
-                errors.append(e.message)
-
-        # Validate NETWORK_MODE
-        if "NETWORK_MODE" in self.config:
-            network_mode = self.config["NETWORK_MODE"]
-            if network_mode not in ("bridge", "default"):
-                errors.append(f"NETWORK_MODE must be 'bridge' or 'default', got: {network_mode}")
-
-        # Validate IP_ADDRESS
-        if "IP_ADDRESS" in self.config:
-            if not self._validate_ipv4(self.config["IP_ADDRESS"]):
-                errors.append(f"Invalid IP_ADDRESS format: {self.config['IP_ADDRESS']}")
-
-        # Validate PORTS
-        if "PORTS" in self.config:
-            try:
-                self._parse_ports(self.config["PORTS"])
-            except ValidationError as e:
-                errors.append(e.message)
-
-        # Validate PROVISIONING_PLAYBOOK
-        if "PROVISIONING_PLAYBOOK" in self.config:
-            playbook_path = Path(self.config["PROVISIONING_PLAYBOOK"])
-            if not playbook_path.exists():
-                errors.append(
-                    f"PROVISIONING_PLAYBOOK not found: {self.config['PROVISIONING_PLAYBOOK']}"
-                )
-            if playbook_path.suffix not in [".yml", ".yaml"]:
-                errors.append("PROVISIONING_PLAYBOOK must be a .yml or .yaml file")
-
-        # Validate PROVISIONING_VARS
-        if "PROVISIONING_VARS" in self.config:
-            vars_path = Path(self.config["PROVISIONING_VARS"])
-            if not vars_path.exists():
-                errors.append(f"PROVISIONING_VARS not found: {self.config['PROVISIONING_VARS']}")
-
-        # Validate PROVISIONING_AUTO_INSTALL_ANSIBLE
-        if "PROVISIONING_AUTO_INSTALL_ANSIBLE" in self.config:
-            value = self.config["PROVISIONING_AUTO_INSTALL_ANSIBLE"].lower()
-            if value not in ["true", "false", "1", "0", "yes", "no"]:
-                errors.append(
-                    "PROVISIONING_AUTO_INSTALL_ANSIBLE must be true/false, 1/0, or yes/no"
-                )
+        # Walk the per-key validator table in a single pass
+        for key, validator in self._VALIDATORS:
+            if key in self.config:
+                validator(self, self.config[key], errors, warnings)
 
         return ValidationResult(len(errors) == 0, errors, warnings)
 
 
-def load_config(env_path: Path | None = None) -> dict[str, str]:
+def load_config(env_path: Path | None = None, publish_env: bool = False) -> dict[str, str]:
     """Load configuration from .env file.
 
     Args:
         env_path: Path to .env file. If None, uses current directory.
+        publish_env: Export parsed values into os.environ.
 
     Returns:
         Configuration dictionary.
     """
     parser = ConfigurationParser(env_path)
-    return parser.load()
+    return parser.load(publish_env=publish_env)
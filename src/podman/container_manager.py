@@ -1,5 +1,6 @@
 """Container manager for Podman-based infrastructure."""
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -9,9 +10,13 @@ from utils.helpers import (
     InfrastructureState,
     ProviderNotAvailableError,
     VagrantpError,
+    iter_ports,
     run_command,
 )
 
+# Fixed argv of the state query, built once instead of per call
+_PS_CMD = ("podman", "ps", "-a", "--format", "{{.Names}}\t{{.Status}}")
+
 
 class ContainerManager:
     """Manager for Podman-based containers."""
@@ -25,22 +30,31 @@ class ContainerManager:
         """
         self.infra_id = infra_id
         self.project_dir = project_dir or Path.cwd()
+        self._cached_state: InfrastructureState | None = None
 
     def _get_state(self) -> InfrastructureState:
-        """Get current state of container by querying Podman directly.
+        """Get current state of container, memoized for the CLI invocation.
+
+        The underlying `podman ps` subprocess is re-run only after one of
+        the state-mutating methods (create, start, stop, remove) clears
+        the cached value.
+
+        Returns:
+            Current container state.
+        """
+        if self._cached_state is None:
+            self._cached_state = self._query_state()
+        return self._cached_state
+
+    def _query_state(self) -> InfrastructureState:
+        """Query current container state from Podman.
 
         Returns:
             Current container state.
         """
         try:
             result = run_command(
-                [
-                    "podman",
-                    "ps",
-                    "-a",
-                    "--format",
-                    "{{.Names}}\t{{.Status}}",
-                ],
+                list(_PS_CMD),
                 cwd=self.project_dir,
                 check=False,
             )
@@ -83,14 +97,15 @@ class ContainerManager:
         except subprocess.CalledProcessError:
             raise ProviderNotAvailableError("podman")
 
-        # Check if container already exists
-        existing = self._check_container_exists()
-        if existing:
+        # Check if container already exists: the state query's podman ps
+        # output answers existence too, so no separate listing is spawned
+        if self._get_state() != InfrastructureState.NOT_CREATED:
             raise VagrantpError(
                 f"Container '{self.infra_id}' already exists", ErrorCode.INFRA_EXISTS
             )
 
         print("  Creating container...")
+        self._cached_state = None
 
         try:
             # Build podman run command
@@ -120,14 +135,16 @@ class ContainerManager:
             return
 
         print(f"  Starting container '{self.infra_id}'...")
+        self._cached_state = None
 
         try:
             run_command(["podman", "start", self.infra_id], cwd=self.project_dir)
 
-            # Wait for container to be running
+            # Wait for container to be running (clear the memo per poll)
             max_wait = 10
             wait_time = 0.0
             while wait_time < max_wait:
+                self._cached_state = None
                 state = self._get_state()
                 if state == InfrastructureState.RUNNING:
                     break
@@ -178,6 +195,32 @@ class ContainerManager:
         except subprocess.CalledProcessError as e:
             raise VagrantpError(f"Failed to connect to container: {e}")
 
+    def connect_exec(self, command: str | None = None) -> None:
+        """Replace the current process with a shell inside the container.
+
+        Unlike connect(), this does not keep the Python interpreter alive
+        as a parent for the whole interactive session — the process image
+        is swapped for podman via os.execvp and control never returns.
+
+        Args:
+            command: Optional command to execute.
+
+        Raises:
+            VagrantpError: If container is not running.
+        """
+        state = self._get_state()
+        if state != InfrastructureState.RUNNING:
+            raise VagrantpError(
+                f"Container '{self.infra_id}' is not running (state: {state.value})",
+                ErrorCode.GENERAL_ERROR,
+            )
+
+        argv = ["podman", "exec", "-it", self.infra_id, "/bin/sh"]
+        if command:
+            argv.extend(["-c", command])
+
+        os.execvp(argv[0], argv)  # nosec B606 - fixed argv, intentional process replacement
+
     def stop(self, force: bool = False) -> None:
         """Stop container.
 
@@ -198,6 +241,7 @@ class ContainerManager:
             return
 
         print(f"  Stopping container '{self.infra_id}'...")
+        self._cached_state = None
 
         try:
             if force:
@@ -205,10 +249,11 @@ class ContainerManager:
             else:
                 run_command(["podman", "stop", self.infra_id], cwd=self.project_dir)
 
-            # Wait for container to be stopped
+            # Wait for container to be stopped (clear the memo per poll)
             max_wait = 10
             wait_time = 0.0
             while wait_time < max_wait:
+                self._cached_state = None
                 state = self._get_state()
                 if state != InfrastructureState.RUNNING:
                     break
@@ -245,6 +290,7 @@ class ContainerManager:
                 self.stop(force=True)
 
         print(f"  Removing container '{self.infra_id}'...")
+        self._cached_state = None
 
         try:
             # Remove container
@@ -257,28 +303,6 @@ class ContainerManager:
         except subprocess.CalledProcessError as e:
             raise VagrantpError(f"Failed to remove container: {e}")
 
-    def _check_container_exists(self) -> bool:
-        """Check if container already exists.
-
-        Returns:
-            True if container exists, False otherwise.
-        """
-        try:
-            result = run_command(
-                [
-                    "podman",
-                    "ps",
-                    "-a",
-                    "--format",
-                    "{{.Names}}",
-                ],
-                cwd=self.project_dir,
-                check=False,
-            )
-            return self.infra_id in result.stdout.strip().split("\n")
-        except subprocess.CalledProcessError:
-            return False
-
     def _build_run_command(self, config: dict[str, Any]) -> list:
         """Build podman run command from configuration.
 
@@ -288,35 +312,37 @@ class ContainerManager:
         Returns:
             List of command arguments.
         """
-        cmd = ["podman", "run", "-d", "--name", self.infra_id]
-
-        # Add resource limits (MEMORY, CPUS)
-        memory = config.get("MEMORY", "512")
-        cpus = config.get("CPUS", "1")
-
-        cmd.extend(["--memory", f"{memory}m"])
-        cmd.extend(["--cpus", str(cpus)])
-
-        # Add networking configuration (NETWORK_MODE, IP_ADDRESS)
-        network_mode = config.get("NETWORK_MODE", "default")
-        if network_mode == "bridge":
-            cmd.extend(["--network", "bridge"])
-        elif network_mode == "default":
-            cmd.extend(["--network", "default"])
+        # One literal covers the always-present args (resource limits
+        # included), so the common case needs no list growth at all
+        cmd = [
+            "podman",
+            "run",
+            "-d",
+            "--name",
+            self.infra_id,
+            "--memory",
+            f"{config.get('MEMORY', '512')}m",
+            "--cpus",
+            str(config.get("CPUS", "1")),
+        ]
+
+        # Add networking configuration (NETWORK_MODE, IP_ADDRESS); podman
+        # already defaults the network, so only bridge needs the flag
+        if config.get("NETWORK_MODE", "default") == "bridge":
+            cmd += ["--network", "bridge"]
 
-        # Add IP address (if specified)
         ip_address = config.get("IP_ADDRESS")
         if ip_address:
-            cmd.extend(["--ip", str(ip_address)])
+            cmd += ["--ip", str(ip_address)]
 
-        # Add port mappings (PORTS)
+        # Add port mappings (PORTS), consumed straight from the generator
         ports_str = config.get("PORTS", "")
         if ports_str:
-            for port_mapping in self._parse_ports(ports_str):
+            for port_mapping in iter_ports(ports_str):
                 if port_mapping["auto"]:
-                    cmd.extend(["-p", f"{port_mapping['container']}"])
+                    cmd += ["-p", f"{port_mapping['container']}"]
                 else:
-                    cmd.extend(["-p", f"{port_mapping['host']}:{port_mapping['container']}"])
+                    cmd += ["-p", f"{port_mapping['host']}:{port_mapping['container']}"]
 
         # Add image (default to alpine)
         image = config.get("IMAGE", "alpine:latest")
@@ -324,7 +350,7 @@ class ContainerManager:
             cmd.append(str(image))
 
         # Add default command to keep container running
-        cmd.extend(["/bin/sh", "-c", "tail -f /dev/null"])
+        cmd += ["/bin/sh", "-c", "tail -f /dev/null"]
 
         return cmd
 
@@ -337,30 +363,4 @@ class ContainerManager:
         Returns:
             List of port mapping dictionaries.
         """
-        ports = []
-
-        for mapping in ports_str.split(","):
-            mapping = mapping.strip()
-
-            if ":" not in mapping:
-                continue
-
-            host_port, container_port = mapping.split(":", 1)
-            host_port = host_port.strip()
-            container_port = container_port.strip()
-
-            try:
-                if host_port.lower() == "auto":
-                    ports.append({"host": 0, "container": int(container_port), "auto": True})
-                else:
-                    ports.append(
-                        {
-                            "host": int(host_port),
-                            "container": int(container_port),
-                            "auto": False,
-                        }
-                    )
-            except ValueError:
-                continue
-
-        return ports
+        return list(iter_ports(ports_str))
@@ -1,6 +1,12 @@
 """Utility functions and helper classes."""
 
+import functools
+import os
+import re
+import select
+import shlex
 import subprocess
+import sys
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -41,18 +47,33 @@ class VagrantpError(Exception):
         self.message = message
         self.code = code
         self.suggestion = suggestion
+        self._dict_cache: dict[str, Any] | None = None
         super().__init__(self.message)
 
+    @functools.cached_property
+    def formatted(self) -> str:
+        """Two-line error rendering, built once per exception instance.
+
+        Returns:
+            Message line plus optional suggestion line.
+        """
+        parts = [f"✗ {self.message}"]
+        if self.suggestion:
+            parts.append(f"  → {self.suggestion}")
+        return "\n".join(parts)
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert error to dictionary.
+        """Convert error to dictionary, built once per exception instance.
 
         Returns:
             Error dictionary with code, message, and suggestion.
         """
-        result = {"code": self.code.name, "message": self.message}
-        if self.suggestion:
-            result["suggestion"] = self.suggestion
-        return result
+        if self._dict_cache is None:
+            result = {"code": self.code.name, "message": self.message}
+            if self.suggestion:
+                result["suggestion"] = self.suggestion
+            self._dict_cache = result
+        return self._dict_cache
 
 
 class ConfigNotFoundError(VagrantpError):
@@ -141,6 +162,160 @@ class ProvisioningFailedError(VagrantpError):
         )
 
 
+def die(exc: VagrantpError) -> None:
+    """Print error diagnostics and exit with the error's code.
+
+    Single exit path for CLI errors: every Vagrantp exception carries its
+    own ErrorCode, so no per-exception-type mapping is needed.
+
+    Args:
+        exc: Error to report.
+    """
+    print(exc.formatted)
+    # Skip SystemExit unwinding and interpreter-shutdown GC: the error path
+    # has nothing pending beyond the flushed streams
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exc.code.value)
+
+
+def cli_error_handler(func):
+    """Decorate a CLI task to report VagrantpError failures via die().
+
+    Replaces the per-task except ladders that previously duplicated the
+    same print/exit block three times per command.
+
+    Args:
+        func: Task function to wrap.
+
+    Returns:
+        Wrapped function.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except VagrantpError as e:
+            die(e)
+
+    return wrapper
+
+
+def iter_ports(ports_str: str, strict: bool = False):
+    """Yield port mappings parsed from a 'host:container' list string.
+
+    Single implementation shared by the config parser and both managers,
+    generating mappings lazily instead of each module materializing its
+    own copy of the parse.
+
+    Args:
+        ports_str: Port mapping string (e.g., '8080:80,auto:443').
+        strict: Raise ValueError for malformed mappings instead of
+            skipping them.
+
+    Yields:
+        Port mapping dictionaries with host, container, and auto keys.
+
+    Raises:
+        ValueError: If strict is True and a mapping is malformed.
+    """
+    for mapping in ports_str.split(","):
+        mapping = mapping.strip()
+
+        if ":" not in mapping:
+            if strict:
+                raise ValueError(f"Invalid port mapping: {mapping}")
+            continue
+
+        host_port, _, container_port = mapping.partition(":")
+        host_port = host_port.strip()
+        container_port = container_port.strip()
+
+        try:
+            if host_port.lower() == "auto":
+                yield {"host": 0, "container": int(container_port), "auto": True}
+            else:
+                yield {"host": int(host_port), "container": int(container_port), "auto": False}
+        except ValueError:
+            if strict:
+                raise ValueError(f"Invalid port mapping: {mapping}") from None
+            continue
+
+
+def ssh_control_args() -> list[str]:
+    """Build SSH options enabling connection multiplexing.
+
+    A persistent control socket lets every SSH command in one CLI flow
+    (connection verify, Ansible tasks) reuse a single handshake instead of
+    paying tens of ms to seconds of negotiation each time. The socket
+    lives under the user cache dir and survives for 120s after last use.
+
+    Returns:
+        List of ssh -o arguments.
+    """
+    control_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "vagrantp"
+    control_dir.mkdir(parents=True, exist_ok=True)
+
+    return [
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={control_dir}/ssh-%C",
+        "-o",
+        "ControlPersist=120s",
+    ]
+
+
+def pump_process_output(process: subprocess.Popen) -> None:
+    """Stream subprocess output to stdout in large chunks.
+
+    Reading 64KiB chunks from a non-blocking pipe replaces one readline()
+    syscall plus decode per output line with O(bytes/64KiB) reads — Ansible
+    playbooks emit thousands of lines, so this is noticeably cheaper.
+
+    Args:
+        process: Process with stdout set to an unbuffered binary pipe.
+    """
+    if not process.stdout:
+        return
+
+    # Drain the text layer first: status lines printed before the pump may
+    # still sit in its block buffer off-TTY, and writing to the underlying
+    # binary buffer would overtake them
+    sys.stdout.flush()
+
+    try:
+        fd = process.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not a real pipe (e.g. a mocked stream); fall back to line iteration
+        for line in process.stdout:
+            print(line, end="")
+        return
+
+    os.set_blocking(fd, False)
+
+    out = sys.stdout.buffer
+    buf = bytearray()
+
+    while True:
+        select.select([fd], [], [])
+        chunk = os.read(fd, 1 << 16)
+        if not chunk:
+            break
+        buf += chunk
+        # Flush on complete lines or when the buffer grows large, so output
+        # stays live without paying a write+flush per chunk
+        if len(buf) > 1 << 16 or chunk.endswith(b"\n"):
+            out.write(buf)
+            out.flush()
+            buf.clear()
+
+    if buf:
+        out.write(buf)
+        out.flush()
+
+
 def run_command(
     cmd: list[str],
     cwd: Path | None = None,
@@ -165,7 +340,8 @@ def run_command(
         return subprocess.run(cmd, cwd=cwd, capture_output=capture_output, text=True, check=check)
     except subprocess.CalledProcessError as e:
         if capture_output:
-            error_msg = f"Command failed: {' '.join(cmd)}\n"
+            # shlex.join keeps args containing spaces copy-pasteable
+            error_msg = f"Command failed: {shlex.join(cmd)}\n"
             if e.stderr:
                 error_msg += f"Error output: {e.stderr}"
             raise subprocess.CalledProcessError(e.returncode, cmd, e.stdout, error_msg) from e
@@ -207,6 +383,10 @@ def write_file(path: Path, content: str) -> None:
     path.write_text(content)
 
 
+# Matches ERB placeholders like '<%= key %>' for single-pass substitution
+_ERB_RE = re.compile(r"<%=\s*(\w+)\s*%>")
+
+
 class TemplateRenderer:
     """Base class for ERB template rendering."""
 
@@ -238,11 +418,9 @@ class TemplateRenderer:
 
         template = read_file(template_path)
 
-        for key, value in context.items():
-            placeholder = f"<%= {key} %>"
-            template = template.replace(placeholder, str(value))
-
-        return template
+        # One linear regex scan instead of a full-string replace() pass per
+        # context key; unknown placeholders are left verbatim
+        return _ERB_RE.sub(lambda m: str(context.get(m.group(1), m.group(0))), template)
 
 
 def get_logger(name: str):
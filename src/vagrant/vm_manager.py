@@ -1,5 +1,6 @@
 """VM manager for Vagrant-based infrastructure."""
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -9,9 +10,13 @@ from utils.helpers import (
     InfrastructureState,
     ProviderNotAvailableError,
     VagrantpError,
+    iter_ports,
     run_command,
 )
 
+# Fixed argv of the state query, built once instead of per call
+_STATUS_CMD = ("vagrant", "status", "--machine-readable")
+
 
 class VMManager:
     """Manager for Vagrant-based virtual machines."""
@@ -26,16 +31,31 @@ class VMManager:
         self.infra_id = infra_id
         self.project_dir = project_dir or Path.cwd()
         self.vagrantfile_path = self.project_dir / "Vagrantfile"
+        self._cached_state: InfrastructureState | None = None
 
     def _get_state(self) -> InfrastructureState:
-        """Get current state of VM by querying Vagrant directly.
+        """Get current state of VM, memoized for the CLI invocation.
+
+        The underlying `vagrant status` subprocess costs hundreds of ms;
+        the cached value is invalidated by the state-mutating methods
+        (create, start, stop, remove).
+
+        Returns:
+            Current VM state.
+        """
+        if self._cached_state is None:
+            self._cached_state = self._query_state()
+        return self._cached_state
+
+    def _query_state(self) -> InfrastructureState:
+        """Query current VM state from Vagrant.
 
         Returns:
             Current VM state.
         """
         try:
             result = run_command(
-                ["vagrant", "status", "--machine-readable"],
+                list(_STATUS_CMD),
                 cwd=self.project_dir,
                 check=False,
             )
@@ -82,6 +102,8 @@ class VMManager:
 
         print("  Creating VM...")
 
+        self._cached_state = None
+
         try:
             # Run vagrant up
             run_command(["vagrant", "up"], cwd=self.project_dir, check=False)
@@ -107,6 +129,7 @@ class VMManager:
             return
 
         print(f"  Starting VM '{self.infra_id}'...")
+        self._cached_state = None
 
         try:
             run_command(["vagrant", "up"], cwd=self.project_dir, check=False)
@@ -147,6 +170,33 @@ class VMManager:
         except subprocess.CalledProcessError as e:
             raise VagrantpError(f"Failed to connect to VM: {e}")
 
+    def connect_exec(self, command: str | None = None) -> None:
+        """Replace the current process with the SSH connection to the VM.
+
+        Unlike connect(), this does not keep the Python interpreter alive
+        as a parent for the whole interactive session — the process image
+        is swapped for vagrant via os.execvp and control never returns.
+
+        Args:
+            command: Optional command to execute.
+
+        Raises:
+            VagrantpError: If VM is not running.
+        """
+        state = self._get_state()
+        if state != InfrastructureState.RUNNING:
+            raise VagrantpError(
+                f"VM '{self.infra_id}' is not running (state: {state.value})",
+                ErrorCode.GENERAL_ERROR,
+            )
+
+        argv = ["vagrant", "ssh"]
+        if command:
+            argv.extend(["-c", command])
+
+        os.chdir(self.project_dir)
+        os.execvp(argv[0], argv)  # nosec B606 - fixed argv, intentional process replacement
+
     def stop(self, force: bool = False) -> None:
         """Stop VM.
 
@@ -167,6 +217,7 @@ class VMManager:
             return
 
         print(f"  Stopping VM '{self.infra_id}'...")
+        self._cached_state = None
 
         try:
             if force:
@@ -202,6 +253,7 @@ class VMManager:
                 self.stop(force=True)
 
         print(f"  Removing VM '{self.infra_id}'...")
+        self._cached_state = None
 
         try:
             run_command(["vagrant", "destroy", "--force"], cwd=self.project_dir)
@@ -254,6 +306,13 @@ Vagrant.configure("2") do |config|
 end
 """
 
+            # Skip the rewrite when nothing changed: keeps the mtime stable
+            # for tooling that watches the Vagrantfile and saves the write
+            try:
+                if self.vagrantfile_path.read_text() == vagrantfile_content:
+                    return
+            except OSError:
+                pass
             self.vagrantfile_path.write_text(vagrantfile_content)
 
         except Exception as e:
@@ -302,30 +361,4 @@ end
         Returns:
             List of port mapping dictionaries.
         """
-        ports = []
-
-        for mapping in ports_str.split(","):
-            mapping = mapping.strip()
-
-            if ":" not in mapping:
-                continue
-
-            host_port, container_port = mapping.split(":", 1)
-            host_port = host_port.strip()
-            container_port = container_port.strip()
-
-            try:
-                if host_port.lower() == "auto":
-                    ports.append({"host": 0, "container": int(container_port), "auto": True})
-                else:
-                    ports.append(
-                        {
-                            "host": int(host_port),
-                            "container": int(container_port),
-                            "auto": False,
-                        }
-                    )
-            except ValueError:
-                continue
-
-        return ports
+        return list(iter_ports(ports_str))
@@ -0,0 +1,86 @@
+"""Unit tests for the CLI entry point."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from cli.main import main
+
+
+class TestMainDispatch:
+    """Tests for argparse command dispatch."""
+
+    @patch("cli.main.up")
+    def test_up_defaults(self, mock_up):
+        """Test 'up' dispatches with default flags."""
+        main(["up"])
+
+        mock_up.assert_called_once_with(dry_run=False, no_provision=False)
+
+    @patch("cli.main.up")
+    def test_up_flags(self, mock_up):
+        """Test 'up' forwards --dry-run and --no-provision."""
+        main(["up", "--dry-run", "--no-provision"])
+
+        mock_up.assert_called_once_with(dry_run=True, no_provision=True)
+
+    @patch("cli.main.ssh")
+    def test_ssh_defaults(self, mock_ssh):
+        """Test 'ssh' dispatches without a command."""
+        main(["ssh"])
+
+        mock_ssh.assert_called_once_with(command=None)
+
+    @patch("cli.main.ssh")
+    def test_ssh_with_command(self, mock_ssh):
+        """Test 'ssh' forwards --command."""
+        main(["ssh", "--command", "uname -a"])
+
+        mock_ssh.assert_called_once_with(command="uname -a")
+
+    @patch("cli.main.stop")
+    def test_stop_force(self, mock_stop):
+        """Test 'stop' forwards --force."""
+        main(["stop", "--force"])
+
+        mock_stop.assert_called_once_with(force=True)
+
+    @patch("cli.main.rm")
+    def test_rm_force(self, mock_rm):
+        """Test 'rm' forwards --force."""
+        main(["rm", "--force"])
+
+        mock_rm.assert_called_once_with(force=True)
+
+    @patch("cli.main.version")
+    def test_version_subcommand(self, mock_version):
+        """Test 'version' dispatches to the version task."""
+        main(["version"])
+
+        mock_version.assert_called_once_with()
+
+    def test_version_flag(self, capsys):
+        """Test --version prints the version and exits cleanly."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--version"])
+
+        # main() switches stdout to block buffering off-TTY, so flush
+        # before reading the captured output
+        sys.stdout.flush()
+        assert exc_info.value.code == 0
+        assert "1.0.0" in capsys.readouterr().out
+
+    def test_missing_command_exits(self):
+        """Test that invoking without a command exits with an error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main([])
+
+        assert exc_info.value.code != 0
+
+    def test_unknown_command_exits(self):
+        """Test that an unknown command exits with an error."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["teleport"])
+
+        assert exc_info.value.code != 0
@@ -230,3 +230,85 @@ class TestConfigurationParser:
         result = parser.validate()
         assert result.valid is False
         assert any("Invalid IP_ADDRESS format" in e for e in result.errors)
+
+
+class TestConfigurationCaches:
+    """Tests for the mtime-keyed load and validation caches."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache_dir(self, tmp_path, monkeypatch):
+        """Point the on-disk caches at a per-test directory."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    def test_load_cached_matches_load(self, tmp_path):
+        """Test that the cached load returns the parsed configuration."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("INFRA_TYPE=vm\nPROVIDER=virtualbox\n")
+        parser = ConfigurationParser(env_file)
+
+        config = parser.load_cached()
+
+        assert config == {"INFRA_TYPE": "vm", "PROVIDER": "virtualbox"}
+
+    def test_load_cached_detects_file_change(self, tmp_path):
+        """Test that editing the .env file invalidates the cached parse."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("INFRA_TYPE=vm\nPROVIDER=virtualbox\n")
+        parser = ConfigurationParser(env_file)
+        parser.load_cached()
+
+        env_file.write_text("INFRA_TYPE=container\nIMAGE=alpine:latest\n")
+        config = parser.load_cached()
+
+        assert config.get("INFRA_TYPE") == "container"
+        assert config.get("IMAGE") == "alpine:latest"
+
+    def test_load_cached_missing_file(self, tmp_path):
+        """Test that the cached load still reports a missing .env file."""
+        parser = ConfigurationParser(tmp_path / "nonexistent.env")
+
+        with pytest.raises(FileNotFoundError):
+            parser.load_cached()
+
+    def test_validate_cached_valid_config(self, tmp_path):
+        """Test that repeated validations of an unchanged file stay valid."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("INFRA_TYPE=vm\nPROVIDER=virtualbox\n")
+        parser = ConfigurationParser(env_file)
+        parser.load()
+
+        assert parser.validate_cached().valid is True
+        assert parser.validate_cached().valid is True
+
+    def test_validate_cached_recomputes_on_change(self, tmp_path):
+        """Test that editing the .env file forces a fresh validation."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("INFRA_TYPE=vm\nPROVIDER=virtualbox\n")
+        parser = ConfigurationParser(env_file)
+        parser.load()
+        assert parser.validate_cached().valid is True
+
+        env_file.write_text("INFRA_TYPE=vm\nPROVIDER=virtualbox\nCPUS=0\n")
+        parser.load()
+
+        result = parser.validate_cached()
+        assert result.valid is False
+        assert any("CPUS must be at least 1" in e for e in result.errors)
+
+    def test_validate_cached_detects_deleted_playbook(self, tmp_path):
+        """Test that removing a referenced playbook invalidates the cache."""
+        playbook = tmp_path / "site.yml"
+        playbook.write_text("---\n- hosts: all\n  tasks: []\n")
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            f"INFRA_TYPE=vm\nPROVIDER=virtualbox\nPROVISIONING_PLAYBOOK={playbook}\n"
+        )
+        parser = ConfigurationParser(env_file)
+        parser.load()
+        assert parser.validate_cached().valid is True
+
+        playbook.unlink()
+
+        result = parser.validate_cached()
+        assert result.valid is False
+        assert any("PROVISIONING_PLAYBOOK not found" in e for e in result.errors)
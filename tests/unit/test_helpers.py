@@ -0,0 +1,75 @@
+"""Unit tests for utility helpers."""
+
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.helpers import iter_ports, pump_process_output
+
+
+class TestIterPorts:
+    """Tests for the shared port-mapping parser."""
+
+    def test_parse_explicit_mappings(self):
+        """Test parsing explicit host:container mappings."""
+        ports = list(iter_ports("8080:80,2222:22"))
+
+        assert ports == [
+            {"host": 8080, "container": 80, "auto": False},
+            {"host": 2222, "container": 22, "auto": False},
+        ]
+
+    def test_parse_auto_mapping(self):
+        """Test parsing auto host-port assignment."""
+        ports = list(iter_ports("auto:443"))
+
+        assert ports == [{"host": 0, "container": 443, "auto": True}]
+
+    def test_invalid_mapping_skipped_by_default(self):
+        """Test that malformed mappings are skipped when not strict."""
+        ports = list(iter_ports("8080:80,invalid,abc:def"))
+
+        assert ports == [{"host": 8080, "container": 80, "auto": False}]
+
+    def test_invalid_mapping_raises_in_strict_mode(self):
+        """Test that malformed mappings raise ValueError in strict mode."""
+        with pytest.raises(ValueError) as exc_info:
+            list(iter_ports("8080:80,invalid", strict=True))
+
+        assert "Invalid port mapping" in str(exc_info.value)
+
+
+class TestPumpProcessOutput:
+    """Tests for chunked subprocess output streaming."""
+
+    def test_streams_real_pipe(self, capfd):
+        """Test streaming output from a real subprocess pipe."""
+        process = subprocess.Popen(
+            ["sh", "-c", "printf 'line1\\nline2\\n'"],
+            stdout=subprocess.PIPE,
+            bufsize=0,
+        )
+
+        pump_process_output(process)
+        process.wait()
+
+        assert capfd.readouterr().out == "line1\nline2\n"
+
+    def test_falls_back_to_line_iteration(self, capsys):
+        """Test fallback for stdout objects without a file descriptor."""
+        process = MagicMock()
+        process.stdout = iter(["mocked1\n", "mocked2\n"])
+
+        pump_process_output(process)
+
+        assert capsys.readouterr().out == "mocked1\nmocked2\n"
+
+    def test_no_stdout_is_a_noop(self, capsys):
+        """Test that a process without stdout produces no output."""
+        process = MagicMock()
+        process.stdout = None
+
+        pump_process_output(process)
+
+        assert capsys.readouterr().out == ""